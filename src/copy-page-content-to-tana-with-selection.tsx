@@ -9,7 +9,7 @@ import {
   getPreferenceValues,
 } from "@raycast/api";
 import { useState, useEffect } from "react";
-import { exec } from "child_process";
+import { execFile } from "child_process";
 import { promisify } from "util";
 import {
   PageInfo,
@@ -20,7 +20,7 @@ import {
 } from "./utils/page-content-extractor";
 import { formatForTana } from "./utils/tana-formatter";
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
 
 /**
  * Enhanced Copy Page Content to Tana with Tab Selection
@@ -96,7 +96,7 @@ async function processTabContent(
 
     // Open Tana and update toast to success
     try {
-      await execAsync("open tana://");
+      await execFileAsync("open", ["tana://"]);
       toast.style = Toast.Style.Success;
       toast.title = "Success!";
       toast.message = "Page content copied to clipboard and Tana opened";
@@ -1,10 +1,10 @@
 import { Clipboard, Toast, showToast, getPreferenceValues } from "@raycast/api";
-import { exec } from "child_process";
+import { execFile } from "child_process";
 import { promisify } from "util";
 import { PageInfo, getActiveTabContent } from "./utils/page-content-extractor";
 import { formatForTana } from "./utils/tana-formatter";
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
 
 /**
  * Enhanced Copy Page Content to Tana
@@ -81,7 +81,7 @@ export default async function Command() {
 
     // Open Tana and update toast to success
     try {
-      await execAsync("open tana://");
+      await execFileAsync("open", ["tana://"]);
       toast.style = Toast.Style.Success;
       toast.title = "Success!";
       toast.message = "Page content copied to clipboard and Tana opened";
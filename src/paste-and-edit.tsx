@@ -8,10 +8,10 @@ import {
   getPreferenceValues,
 } from "@raycast/api";
 import { formatForTana } from "./utils/tana-formatter";
-import { exec } from "child_process";
+import { execFile } from "child_process";
 import { promisify } from "util";
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
 
 /**
  * Form values for the paste and edit interface
@@ -109,7 +109,7 @@ export default function Command() {
 
       // Open Tana
       try {
-        await execAsync("open tana://");
+        await execFileAsync("open", ["tana://"]);
         await showHUD("Tana format copied to clipboard. Opening Tana... ✨");
       } catch (error) {
         console.error("Error opening Tana:", error);
@@ -1,9 +1,9 @@
 import { Clipboard, showHUD, getPreferenceValues } from "@raycast/api";
 import { formatForTana } from "./utils/tana-formatter";
-import { exec } from "child_process";
+import { execFile } from "child_process";
 import { promisify } from "util";
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
 
 /**
  * Raycast command that converts clipboard content to Tana format and opens Tana app
@@ -40,7 +40,7 @@ export default async function Command() {
 
     // Open Tana
     try {
-      await execAsync("open tana://");
+      await execFileAsync("open", ["tana://"]);
       await showHUD("Tana format copied to clipboard. Opening Tana... ✨");
     } catch (error) {
       console.error("Error opening Tana:", error);
@@ -5,8 +5,16 @@ import {
   TanaFormatOptions,
   formatForTanaMarkdown as formatForTanaMarkdownUnified,
   PageInfo,
+  getIndentWidth,
+  getLeadingWhitespace,
 } from "./tana-formatter";
 
+const BROKEN_LINK_URL_PATTERN = /^]\(([^)]+)\)(.*)$/;
+const IMAGE_LINE_PATTERN = /^!.*https?:\/\//;
+const TANA_HEADING_PATTERN = /^(\s*)- !! (.+)$/;
+// Raycast-escaped markdown characters: \# \* \_ \[ \] \.
+const ESCAPED_MARKDOWN_PATTERN = /\\([#*_[\].])/g;
+
 /**
  * Shared utilities for page content extraction and processing
  */
@@ -14,6 +22,10 @@ import {
 // Re-export PageInfo for backward compatibility
 export type { PageInfo };
 
+// removeColonsInContent lives in the Tana formatter; re-export it so existing
+// imports from this module keep working
+export { removeColonsInContent } from "./tana-formatter";
+
 /**
  * Timeout wrapper for Browser Extension API calls
  */
@@ -297,9 +309,11 @@ function processBrokenLink(
   baseUrl: string,
 ): { linesConsumed: number; output: string } {
   const startLine = lines[startIndex];
-  const baseIndent = startLine.match(/^(\s*)/)?.[1] || "";
+  const baseIndent = getLeadingWhitespace(startLine);
 
-  let linkText = "";
+  // Collect link text fragments and join once, rather than re-concatenating
+  // the growing string for every line scanned
+  const linkTextParts: string[] = [];
   let linkUrl = "";
   let linesConsumed = 1; // Start with the current line
 
@@ -308,13 +322,14 @@ function processBrokenLink(
     const nextLine = lines[j].trim();
 
     // Check if this line contains the URL part: ](url)
-    const urlMatch = nextLine.match(/^]\(([^)]+)\)(.*)$/);
+    const urlMatch = nextLine.match(BROKEN_LINK_URL_PATTERN);
     if (urlMatch) {
       linkUrl = urlMatch[1];
       const remaining = urlMatch[2].trim();
       linesConsumed = j - startIndex + 1;
+      const linkText = linkTextParts.join(" ").trim();
 
-      if (linkText.trim() && linkUrl.trim()) {
+      if (linkText && linkUrl.trim()) {
         // Convert relative URLs to absolute URLs if we have a base URL
         const absoluteUrl = baseUrl
           ? makeAbsoluteUrl(linkUrl, baseUrl)
@@ -322,18 +337,18 @@ function processBrokenLink(
         // Format for Tana: Text [URL](URL)
         return {
           linesConsumed,
-          output: `${baseIndent}- ${linkText.trim()} [${absoluteUrl}](${absoluteUrl})${remaining ? " " + remaining : ""}`,
+          output: `${baseIndent}- ${linkText} [${absoluteUrl}](${absoluteUrl})${remaining ? " " + remaining : ""}`,
         };
       } else {
         // If we can't form a proper link, just add the text
         return {
           linesConsumed,
-          output: `${baseIndent}- ${linkText.trim()}${remaining ? " " + remaining : ""}`,
+          output: `${baseIndent}- ${linkText}${remaining ? " " + remaining : ""}`,
         };
       }
     } else {
       // Accumulate link text
-      linkText = linkText ? linkText + " " + nextLine : nextLine;
+      linkTextParts.push(nextLine);
     }
   }
 
@@ -394,7 +409,7 @@ export function cleanContentForTana(
       }
 
       // Remove image references (both !Image url and ![](url) formats)
-      if (cleanLine.match(/^!.*https?:\/\//)) {
+      if (IMAGE_LINE_PATTERN.test(cleanLine)) {
         return "";
       }
 
@@ -503,7 +518,9 @@ export async function extractMainContent(
             return "";
           const element = node as HTMLTableElement;
 
-          const rows = Array.from(element.querySelectorAll("tr"));
+          // Index into the NodeList directly rather than copying it into an
+          // array first
+          const rows = element.querySelectorAll("tr");
           if (rows.length === 0) return "";
 
           const result: string[] = [];
@@ -512,20 +529,21 @@ export async function extractMainContent(
           let headers: string[] = [];
           let hasHeaderRow = false;
 
-          rows.forEach((row: HTMLTableRowElement) => {
-            const cells = Array.from(row.querySelectorAll("td, th"));
-            const cellContents = cells.map((cell: Element) =>
-              (cell.textContent || "").trim(),
+          for (let i = 0; i < rows.length; i++) {
+            const row = rows[i];
+            const cellContents = Array.from(
+              row.querySelectorAll("td, th"),
+              (cell: Element) => (cell.textContent || "").trim(),
             );
 
             // Skip completely empty rows
             if (cellContents.every((content) => content.length === 0)) {
-              return;
+              continue;
             }
 
             // Check if this row contains header cells (th elements)
             const isHeaderRow =
-              Array.from(row.querySelectorAll("th")).length > 0 ||
+              row.querySelector("th") !== null ||
               row.closest("thead") !== null;
 
             if (isHeaderRow && !hasHeaderRow) {
@@ -533,7 +551,7 @@ export async function extractMainContent(
               headers = cellContents.filter((content) => content.length > 0);
               if (headers.length > 0) {
                 result.push(`| ${headers.join(" | ")} |`);
-                result.push(`| ${headers.map(() => "---").join(" | ")} |`);
+                result.push(`|${" --- |".repeat(headers.length)}`);
                 hasHeaderRow = true;
               }
             } else {
@@ -544,7 +562,7 @@ export async function extractMainContent(
               if (!hasHeaderRow && dataCells.length > 0) {
                 headers = dataCells.map((_, index) => `Column ${index + 1}`);
                 result.push(`| ${headers.join(" | ")} |`);
-                result.push(`| ${headers.map(() => "---").join(" | ")} |`);
+                result.push(`|${" --- |".repeat(headers.length)}`);
                 hasHeaderRow = true;
               }
 
@@ -557,7 +575,7 @@ export async function extractMainContent(
                 result.push(`| ${dataCells.join(" | ")} |`);
               }
             }
-          });
+          }
 
           return result.length > 0 ? "\n" + result.join("\n") + "\n" : "";
         },
@@ -603,14 +621,14 @@ export function convertTanaHeadersToParentNodes(tanaText: string): string {
     // Check if we're entering the Content:: field
     if (line.includes("Content::")) {
       insideContentField = true;
-      contentFieldBaseIndent = (line.match(/^(\s*)/)?.[1]?.length || 0) + 2; // Base indent + 2 for field content
+      contentFieldBaseIndent = getIndentWidth(line) + 2; // Base indent + 2 for field content
       result.push(line);
       continue;
     }
 
     // Check if we're exiting the Content:: field (line with same or less indentation than Content:: field)
     if (insideContentField) {
-      const currentIndent = line.match(/^(\s*)/)?.[1]?.length || 0;
+      const currentIndent = getIndentWidth(line);
       const contentFieldIndent = contentFieldBaseIndent - 2; // The Content:: field itself indentation
 
       if (
@@ -624,13 +642,13 @@ export function convertTanaHeadersToParentNodes(tanaText: string): string {
 
     if (insideContentField && line.trim().length > 0) {
       // Ensure content lines have proper indentation under Content:: field
-      const currentIndent = line.match(/^(\s*)/)?.[1]?.length || 0;
+      const currentIndent = getIndentWidth(line);
       const minRequiredIndent = contentFieldBaseIndent;
 
       let processedLine = line;
 
       // Convert Tana headings to regular parent nodes
-      const headingMatch = line.match(/^(\s*)- !! (.+)$/);
+      const headingMatch = line.match(TANA_HEADING_PATTERN);
       if (headingMatch) {
         const [, indentation, headingText] = headingMatch;
         processedLine = `${indentation}- ${headingText}`;
@@ -645,7 +663,7 @@ export function convertTanaHeadersToParentNodes(tanaText: string): string {
       result.push(processedLine);
     } else {
       // Convert headings outside content field
-      const headingMatch = line.match(/^(\s*)- !! (.+)$/);
+      const headingMatch = line.match(TANA_HEADING_PATTERN);
       if (headingMatch) {
         const [, indentation, headingText] = headingMatch;
         result.push(`${indentation}- ${headingText}`);
@@ -658,44 +676,18 @@ export function convertTanaHeadersToParentNodes(tanaText: string): string {
   return result.join("\n");
 }
 
-/**
- * Remove :: in content to prevent field creation (apply BEFORE Tana conversion)
- */
-export function removeColonsInContent(content: string): string {
-  return content
-    .split("\n")
-    .map((line) => {
-      // Remove all :: to prevent any field creation in content
-      return line.replace(/::/g, ":");
-    })
-    .join("\n");
-}
-
 /**
  * Unescape Raycast's escaped markdown syntax to get proper markdown
  */
 export function unescapeRaycastMarkdown(content: string): string {
-  return content
-    .split("\n")
-    .map((line) => {
-      let unescapedLine = line;
-
-      // Unescape headings: \# -> #
-      unescapedLine = unescapedLine.replace(/\\#/g, "#");
-
-      // Unescape other common markdown escapes
-      unescapedLine = unescapedLine.replace(/\\\*/g, "*");
-      unescapedLine = unescapedLine.replace(/\\_/g, "_");
-      unescapedLine = unescapedLine.replace(/\\\[/g, "[");
-      unescapedLine = unescapedLine.replace(/\\\]/g, "]");
-      unescapedLine = unescapedLine.replace(/\\\./g, ".");
-
-      // Note: Don't convert numbered sections here - TurndownService already handles <h2> -> ## conversion
-      // We were double-processing and breaking the proper headings
-
-      return unescapedLine;
-    })
-    .join("\n");
+  if (!content.includes("\\")) return content;
+
+  // Unescape headings (\# -> #) and other common markdown escapes in a single
+  // pass over the whole text - an escape never spans a newline, so there is
+  // no need to split into lines first
+  // Note: Don't convert numbered sections here - TurndownService already handles <h2> -> ## conversion
+  // We were double-processing and breaking the proper headings
+  return content.replace(ESCAPED_MARKDOWN_PATTERN, "$1");
 }
 
 /**
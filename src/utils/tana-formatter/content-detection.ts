@@ -3,6 +3,14 @@
  * Determines what type of content we're dealing with for appropriate processing
  */
 
+const PENDANT_LINE_TEST_PATTERN = /^>\s*\[(.*?)\]\(#startMs=\d+&endMs=\d+\):/;
+// Day names share the "day" suffix, so the alternation only lists the
+// distinct prefixes; nothing is captured since only a yes/no answer is needed
+const APP_TIMESTAMP_PATTERN =
+  /(?:Yester|To|Mon|Tues|Wednes|Thurs|Fri|Satur|Sun)day,\s+\d{1,2}:\d{2}\s+[AP]M/;
+// "Transcript:" followed by a second colon or whitespace (including newlines)
+export const TRANSCRIPT_MARKER_PATTERN = /\bTranscript:(?::|\s)/i;
+
 /**
  * Detect if text is a Limitless Pendant transcription
  * Format: > [Speaker](#startMs=timestamp&endMs=timestamp): Content
@@ -14,13 +22,21 @@ export function isLimitlessPendantTranscription(text: string): boolean {
 
   const pendantFormatCount = text
     .split("\n")
-    .filter((line) =>
-      line.match(/^>\s*\[(.*?)\]\(#startMs=\d+&endMs=\d+\):/),
-    ).length;
+    .filter((line) => PENDANT_LINE_TEST_PATTERN.test(line)).length;
 
   return pendantFormatCount >= 2; // At least 2 lines to consider it a transcript
 }
 
+/**
+ * Detect if a line contains a Limitless App timestamp
+ * Format: Today/Yesterday/weekday, H:MM AM|PM
+ */
+export function isLimitlessTimestamp(line: string): boolean {
+  // Every timestamp contains the literal "day," so lines without it skip the
+  // day name alternation entirely
+  return line.includes("day,") && APP_TIMESTAMP_PATTERN.test(line);
+}
+
 /**
  * Detect if text is in the new Limitless App transcription format
  * Format: Speaker Name followed by empty line, then timestamp, then content
@@ -41,13 +57,7 @@ export function isLimitlessAppTranscription(text: string): boolean {
     ).length;
 
   // Count timestamps
-  const timestampCount = lines.filter((line) =>
-    line
-      .trim()
-      .match(
-        /(Yesterday|Today|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+\d{1,2}:\d{2}\s+(AM|PM)/,
-      ),
-  ).length;
+  const timestampCount = lines.filter(isLimitlessTimestamp).length;
 
   return speakerCount >= 2 && timestampCount >= 2;
 }
@@ -61,7 +71,7 @@ export function isYouTubeTranscript(text: string): boolean {
   }
 
   // Check if there's a Transcript field or marker
-  return /\bTranscript:(?::|\s|\n)/i.test(text);
+  return TRANSCRIPT_MARKER_PATTERN.test(text);
 }
 
 /**
@@ -2,8 +2,76 @@
  * Content processing utilities for different content types
  * Handles the specific processing needed for each format
  */
+import {
+  isLimitlessTimestamp,
+  TRANSCRIPT_MARKER_PATTERN,
+} from "./content-detection";
 import { chunkTranscript, TranscriptChunk } from "./transcript-chunking";
 
+// Heading and line cleanup patterns
+const HEADING_PATTERN = /^(#{1,6})\s+(.+)$/;
+export const HAS_HEADINGS_PATTERN = /^#{1,6}\s+.+$/m;
+const HASH_PATTERN = /#/g;
+const DOUBLE_COLON_PATTERN = /::/g;
+export const INVISIBLE_ONLY_PATTERN =
+  /^[\s\u200B\u200C\u200D\u200E\u200F\u2028\u2029\uFEFF]*$/;
+
+// Inline markdown formatting patterns
+const ASTERISK_ITALIC_PATTERN = /(^|[^*])\*([^*\n]+?)\*(?!\*)/g;
+const UNDERSCORE_ITALIC_PATTERN = /(^|[^_])_([^_\n]+?)_(?!_)/g;
+const HIGHLIGHT_PATTERN = /==([^=\n]+)==/g;
+const BLOCKQUOTE_PATTERN = /^>\s*(.+)$/gm;
+const IMAGE_PATTERN = /!\[([^\]]*)\]\(([^)]+)\)/g;
+
+// List item pattern - one alternation per supported list format, tried in
+// priority order so a single match call classifies the line:
+// - markdown bullets: - * + (with one or more spaces)
+// - Unicode bullets commonly used by browsers: • ‣ ▸ ▪ ▫ ▬ ◦
+// - standalone bullet characters (just the bullet, content on next line)
+// - numbered lists: 1. 2. etc.
+// - lettered lists: a. b. etc.
+// - roman numerals: i. ii. iii. etc. (either case)
+const LIST_ITEM_PATTERN =
+  /^(?:[-*+]\s+(?<markdown>.+)|[•‣▸▪▫▬◦]\s+(?<unicode>.+)|(?<standalone>[•‣▸▪▫▬◦])|\d+\.\s+(?<numbered>.+)|[a-z]\.\s+(?<lettered>.+)|[ivxIVX]+\.\s+(?<roman>.+))$/;
+
+// Characters a list item can start with. Lines starting with anything else
+// are classified with one lookup and never reach LIST_ITEM_PATTERN
+const LIST_ITEM_FIRST_CHARS: ReadonlySet<string> = new Set(
+  "-*+•‣▸▪▫▬◦0123456789abcdefghijklmnopqrstuvwxyzIVX",
+);
+
+// LRU cache of convertMarkdownToTana results, bounded by count and length
+const CONVERTED_LINE_CACHE_SIZE = 4096;
+const CONVERTED_LINE_CACHE_MAX_LENGTH = 512;
+const CONVERTED_LINE_CACHE = new Map<string, string>();
+
+// Literal empty bullet markers, checked with one table lookup
+export const EMPTY_BULLET_MARKERS: ReadonlySet<string> = new Set([
+  "-",
+  "•",
+  "*",
+  "- •",
+  "- *",
+  "-•",
+  "-*",
+]);
+// Empty bullet: a dash followed by whitespace, bullet/invisible characters,
+// zero-width joiners and trailing whitespace, in that order. \s overlaps
+// the invisible character class (U+2028, U+2029, U+FEFF), so the first two
+// runs are matched atomically via lookahead + backreference; otherwise a
+// long run of those characters backtracks in cubic time.
+export const EMPTY_BULLET_PATTERN =
+  /^-(?=(\s*))\1(?=([•*\u200B\u200C\u200E\u200F\u2028\u2029\uFEFF]*))\2\u200D*\s*$/;
+export const DASHES_ONLY_PATTERN =
+  /^[-\s\u200B\u200C\u200E\u200F\u2028\u2029\uFEFF]*\u200D*$/;
+
+// Transcript patterns
+const PENDANT_LINE_CAPTURE_PATTERN =
+  /^>\s*\[(.*?)\]\(#startMs=(\d+)&endMs=\d+\):\s*(.*?)$/;
+const TRANSCRIPT_PREFIX_PATTERN = /^.*?\bTranscript:(?::|\s)/;
+const FIELD_MARKER_PATTERN = /^[^:]+::/;
+const HASHTAG_PATTERN = /#\w+\b/g;
+
 /**
  * Represents a hierarchical content node
  */
@@ -61,8 +129,11 @@ export function parseMarkdownStructure(content: string): ContentNode[] {
     const trimmedLine = line.trim();
     if (!trimmedLine) continue;
 
-    // Check for heading
-    const headingMatch = trimmedLine.match(/^(#{1,6})\s+(.+)$/);
+    // Check for heading - only lines starting with # can be headings, so
+    // everything else skips the regex
+    const headingMatch = trimmedLine.startsWith("#")
+      ? trimmedLine.match(HEADING_PATTERN)
+      : null;
     if (headingMatch) {
       // Save current section if it has content
       if (currentSection.heading || currentSection.content.length > 0) {
@@ -166,24 +237,73 @@ function buildHierarchy(sections: ContentSection[]): ContentNode[] {
 export function convertMarkdownToTana(text: string): string {
   if (!text) return "";
 
+  // Only short single lines are cached: they repeat often (bullets,
+  // headings, boilerplate), while long text would pin large strings
+  if (text.length > CONVERTED_LINE_CACHE_MAX_LENGTH || text.includes("\n")) {
+    return convertMarkdownFormatting(text);
+  }
+
+  const cached = CONVERTED_LINE_CACHE.get(text);
+  if (cached !== undefined) {
+    // Re-insert so the entry becomes the most recently used
+    CONVERTED_LINE_CACHE.delete(text);
+    CONVERTED_LINE_CACHE.set(text, cached);
+    return cached;
+  }
+
+  const result = convertMarkdownFormatting(text);
+  if (CONVERTED_LINE_CACHE.size >= CONVERTED_LINE_CACHE_SIZE) {
+    // Evict the least recently used entry (Maps iterate in insertion order)
+    const oldest = CONVERTED_LINE_CACHE.keys().next().value;
+    if (oldest !== undefined) {
+      CONVERTED_LINE_CACHE.delete(oldest);
+    }
+  }
+  CONVERTED_LINE_CACHE.set(text, result);
+  return result;
+}
+
+/**
+ * Apply the markdown to Tana formatting conversions to text
+ *
+ * Uncached implementation behind convertMarkdownToTana.
+ *
+ * @param text - Non-empty markdown text to convert
+ * @returns Text formatted for Tana with proper syntax
+ */
+function convertMarkdownFormatting(text: string): string {
   let result = text;
 
+  // Each conversion below only runs when its marker is present in the text.
+  // Plain prose lines usually contain none of them, so the checks skip the
+  // regex passes entirely for most input.
+
   // Convert italic: *text* (single asterisk, not bold) or _text_ to __text__ (Tana italic format)
   // Handle single asterisks for italic (but not double asterisks for bold)
   // Match single asterisk that's not preceded or followed by another asterisk
-  result = result.replace(/(^|[^*])\*([^*\n]+?)\*(?!\*)/g, "$1__$2__");
+  if (result.includes("*")) {
+    result = result.replace(ASTERISK_ITALIC_PATTERN, "$1__$2__");
+  }
   // Handle underscore italic (single underscores, not double)
   // Match single underscore that's not preceded or followed by another underscore
-  result = result.replace(/(^|[^_])_([^_\n]+?)_(?!_)/g, "$1__$2__");
+  if (result.includes("_")) {
+    result = result.replace(UNDERSCORE_ITALIC_PATTERN, "$1__$2__");
+  }
 
   // Convert highlight: ==text== to ^^text^^ (Tana highlight format)
-  result = result.replace(/==([^=\n]+)==/g, "^^$1^^");
+  if (result.includes("==")) {
+    result = result.replace(HIGHLIGHT_PATTERN, "^^$1^^");
+  }
 
   // Convert blockquotes: > text to indented format
-  result = result.replace(/^>\s*(.+)$/gm, "  - $1");
+  if (result.includes(">")) {
+    result = result.replace(BLOCKQUOTE_PATTERN, "  - $1");
+  }
 
   // Convert images: ![alt](url) to ![](url) (simplify alt text for Tana)
-  result = result.replace(/!\[([^\]]*)\]\(([^)]+)\)/g, "![]($2)");
+  if (result.includes("![")) {
+    result = result.replace(IMAGE_PATTERN, "![]($2)");
+  }
 
   // Convert markdown lists to proper Tana bullet format
   result = convertMarkdownLists(result);
@@ -205,57 +325,64 @@ export function convertMarkdownToTana(text: string): string {
  * @returns Text with all lists converted to Tana bullet format
  */
 function convertMarkdownLists(text: string): string {
-  const lines = text.split("\n");
+  // Single lines (the common case when called line by line) are converted
+  // directly without a split/join round trip
+  if (!text.includes("\n")) {
+    return convertListLine(text) ?? "";
+  }
+
   const result: string[] = [];
 
-  for (const line of lines) {
-    const trimmed = line.trim();
-
-    // Enhanced list detection for various formats
-    // Standard markdown bullets: - * + (with one or more spaces)
-    const markdownMatch = trimmed.match(/^[-*+]\s+(.+)$/);
-    // Unicode bullets commonly used by browsers: • ‣ ▸ ▪ ▫ ▬ ◦ (with one or more spaces)
-    const unicodeBulletMatch = trimmed.match(/^[•‣▸▪▫▬◦]\s+(.+)$/);
-    // Standalone bullet characters (just the bullet, content on next line)
-    const standaloneBulletMatch = trimmed.match(/^[•‣▸▪▫▬◦]$/);
-    // Numbered lists: 1. 2. etc. (with one or more spaces)
-    const numberedMatch = trimmed.match(/^\d+\.\s+(.+)$/);
-    // Lettered lists: a. b. etc. (with one or more spaces)
-    const letteredMatch = trimmed.match(/^[a-z]\.\s+(.+)$/);
-    // Roman numerals: i. ii. iii. etc. (with one or more spaces)
-    const romanMatch = trimmed.match(/^[ivx]+\.\s+(.+)$/i);
-
-    if (markdownMatch) {
-      // Convert markdown list items
-      const indent = line.match(/^(\s*)/)?.[1] || "";
-      result.push(`${indent}- ${markdownMatch[1]}`);
-    } else if (unicodeBulletMatch) {
-      // Convert Unicode bullet list items
-      const indent = line.match(/^(\s*)/)?.[1] || "";
-      result.push(`${indent}- ${unicodeBulletMatch[1]}`);
-    } else if (standaloneBulletMatch) {
-      // Skip standalone bullet characters (they're just separators)
-    } else if (numberedMatch) {
-      // Convert numbered list items to bullets
-      const indent = line.match(/^(\s*)/)?.[1] || "";
-      result.push(`${indent}- ${numberedMatch[1]}`);
-    } else if (letteredMatch) {
-      // Convert lettered list items to bullets
-      const indent = line.match(/^(\s*)/)?.[1] || "";
-      result.push(`${indent}- ${letteredMatch[1]}`);
-    } else if (romanMatch) {
-      // Convert roman numeral list items to bullets
-      const indent = line.match(/^(\s*)/)?.[1] || "";
-      result.push(`${indent}- ${romanMatch[1]}`);
-    } else {
-      // Preserve non-list lines as-is
-      result.push(line);
+  for (const line of text.split("\n")) {
+    const converted = convertListLine(line);
+    if (converted !== null) {
+      result.push(converted);
     }
   }
 
   return result.join("\n");
 }
 
+/**
+ * Convert a single line to Tana bullet format if it is a list item
+ *
+ * @param line - Line of text that may be a list item
+ * @returns The converted line, the line unchanged if it is not a list item,
+ * or null for standalone bullet characters that should be dropped
+ */
+function convertListLine(line: string): string | null {
+  const trimmed = line.trim();
+
+  if (!LIST_ITEM_FIRST_CHARS.has(trimmed[0])) {
+    // Preserve non-list lines as-is
+    return line;
+  }
+
+  // Enhanced list detection for various formats
+  const listMatch = trimmed.match(LIST_ITEM_PATTERN);
+  const groups = listMatch?.groups;
+
+  if (!groups) {
+    // Preserve non-list lines as-is
+    return line;
+  }
+
+  if (groups.standalone) {
+    // Skip standalone bullet characters (they're just separators)
+    return null;
+  }
+
+  // Convert markdown, Unicode, numbered, lettered and roman numeral
+  // list items to bullets
+  const item =
+    groups.markdown ??
+    groups.unicode ??
+    groups.numbered ??
+    groups.lettered ??
+    groups.roman;
+  return `${getLeadingWhitespace(line)}- ${item}`;
+}
+
 /**
  * Convert hierarchical content nodes to Tana format
  *
@@ -271,6 +398,26 @@ export function convertNodesToTana(
   depth: number = 0,
 ): string[] {
   const result: string[] = [];
+  appendNodesAsTana(nodes, depth, result);
+  return result;
+}
+
+/**
+ * Append the Tana lines for hierarchical content nodes to an output array
+ *
+ * Recursion target for convertNodesToTana. Every nesting level writes into
+ * the same output array, so each line is stored once instead of being
+ * copied into the result of every ancestor heading.
+ *
+ * @param nodes - Array of ContentNode objects to convert
+ * @param depth - Current indentation depth
+ * @param result - Output array receiving formatted Tana lines
+ */
+function appendNodesAsTana(
+  nodes: ContentNode[],
+  depth: number,
+  result: string[],
+): void {
   const indent = "  ".repeat(depth);
 
   for (const node of nodes) {
@@ -280,7 +427,7 @@ export function convertNodesToTana(
 
       // Add children with increased indentation
       if (node.children.length > 0) {
-        result.push(...convertNodesToTana(node.children, depth + 1));
+        appendNodesAsTana(node.children, depth + 1, result);
       }
     } else {
       // Process content line
@@ -297,7 +444,7 @@ export function convertNodesToTana(
         }
 
         // Preserve original indentation from markdown
-        const originalIndent = line.match(/^(\s*)/)?.[1] || "";
+        const originalIndent = getLeadingWhitespace(line);
 
         if (cleanedText.startsWith("- ")) {
           // Already a bullet - preserve original indentation relative to base
@@ -309,8 +456,29 @@ export function convertNodesToTana(
       }
     }
   }
+}
 
-  return result;
+/**
+ * Get the width of a line's leading whitespace
+ *
+ * Derived from the length of the left-trimmed line rather than a regex
+ * match; trimStart removes exactly the characters matched by \s.
+ *
+ * @param line - Text line to inspect
+ * @returns Number of leading whitespace characters (0 if none)
+ */
+export function getIndentWidth(line: string): number {
+  return line.length - line.trimStart().length;
+}
+
+/**
+ * Get the leading whitespace of a line
+ *
+ * @param line - Text line to inspect
+ * @returns The whitespace prefix of the line (empty string if none)
+ */
+export function getLeadingWhitespace(line: string): string {
+  return line.slice(0, getIndentWidth(line));
 }
 
 /**
@@ -325,17 +493,9 @@ export function convertNodesToTana(
 function isEmptyBulletNode(line: string): boolean {
   const trimmed = line.trim();
   return (
-    trimmed === "-" ||
-    trimmed === "•" ||
-    trimmed === "*" ||
-    trimmed === "- •" ||
-    trimmed === "- *" ||
-    trimmed === "-•" ||
-    trimmed === "-*" ||
-    /^-\s*[•*\u200B\u200C\u200E\u200F\u2028\u2029\uFEFF]*(\u200D)*\s*$/u.test(
-      trimmed,
-    ) ||
-    /^[-\s\u200B\u200C\u200E\u200F\u2028\u2029\uFEFF]*(\u200D)*$/u.test(trimmed)
+    EMPTY_BULLET_MARKERS.has(trimmed) ||
+    EMPTY_BULLET_PATTERN.test(trimmed) ||
+    DASHES_ONLY_PATTERN.test(trimmed)
   );
 }
 
@@ -357,9 +517,7 @@ export function processLimitlessPendantTranscript(text: string): string {
     .filter((line) => line.startsWith(">")) // Keep only pendant format lines
     .map((line) => {
       // Extract speaker and content from pendant format
-      const match = line.match(
-        /^>\s*\[(.*?)\]\(#startMs=(\d+)&endMs=\d+\):\s*(.*?)$/,
-      );
+      const match = line.match(PENDANT_LINE_CAPTURE_PATTERN);
       if (!match) return line;
       const [, speaker, , content] = match;
       return `${speaker}: ${content}`;
@@ -399,11 +557,7 @@ export function processLimitlessAppTranscript(text: string): string {
     }
 
     // Skip timestamp lines
-    if (
-      line.match(
-        /(Yesterday|Today|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+\d{1,2}:\d{2}\s+(AM|PM)/,
-      )
-    ) {
+    if (isLimitlessTimestamp(line)) {
       continue;
     }
 
@@ -434,7 +588,7 @@ export function processYouTubeTranscript(text: string): string {
 
   // Find the transcript start index
   const transcriptStartIndex = lines.findIndex((line) =>
-    line.match(/\bTranscript:(?::|\s)/i),
+    TRANSCRIPT_MARKER_PATTERN.test(line),
   );
 
   if (transcriptStartIndex === -1) {
@@ -443,7 +597,8 @@ export function processYouTubeTranscript(text: string): string {
 
   // Find the end of transcript (next field marker after transcript start)
   const transcriptEndIndex = lines.findIndex(
-    (line, index) => index > transcriptStartIndex && line.match(/^[^:]+::/),
+    (line, index) =>
+      index > transcriptStartIndex && FIELD_MARKER_PATTERN.test(line),
   );
 
   // Extract transcript lines (from start to end or to the end of array)
@@ -458,12 +613,12 @@ export function processYouTubeTranscript(text: string): string {
       if (index === 0) {
         // First line: extract content after "Transcript:" label
         const transcriptPart = line
-          .replace(/^.*?\bTranscript:(?::|\s)/, "")
+          .replace(TRANSCRIPT_PREFIX_PATTERN, "")
           .trim();
-        return transcriptPart.replace(/#\w+\b/g, "").trim();
+        return transcriptPart.replace(HASHTAG_PATTERN, "").trim();
       } else {
         // Other lines: clean hashtags
-        return line.replace(/#\w+\b/g, "").trim();
+        return line.replace(HASHTAG_PATTERN, "").trim();
       }
     })
     .filter((line) => line) // Remove empty lines
@@ -505,14 +660,16 @@ export function cleanContentForTana(content: string): string {
   if (!content) return "";
 
   // Check if content has markdown headings - if so, use hierarchical processing
-  const hasHeadings = /^#{1,6}\s+.+$/m.test(content);
+  const hasHeadings = HAS_HEADINGS_PATTERN.test(content);
 
   if (hasHeadings) {
     // Use hierarchical markdown processing
     const nodes = parseMarkdownStructure(content);
     const tanaLines = convertNodesToTana(nodes);
     // Escape # in content (but headings are already converted to !! format)
-    const escapedLines = tanaLines.map((line) => line.replace(/#/g, "\\#"));
+    const escapedLines = tanaLines.map((line) =>
+      line.replace(HASH_PATTERN, "\\#"),
+    );
     return escapedLines.join("\n");
   } else {
     // Use simple line-by-line processing for content without headings
@@ -523,11 +680,7 @@ export function cleanContentForTana(content: string): string {
         const trimmedLine = processedLine.trim();
 
         // Skip empty bullet-only lines and lines with only invisible characters
-        const cleaned = trimmedLine.replace(
-          /[\s\u200B\u200C\u200E\u200F\u2028\u2029\uFEFF]|\u200D/gu,
-          "",
-        );
-        if (cleaned.length === 0) {
+        if (INVISIBLE_ONLY_PATTERN.test(trimmedLine)) {
           return "";
         }
 
@@ -536,9 +689,9 @@ export function cleanContentForTana(content: string): string {
         }
 
         // Escape # symbols to prevent unwanted tag creation (but not in headings)
-        return trimmedLine.replace(/#/g, "\\#");
+        return trimmedLine.replace(HASH_PATTERN, "\\#");
       })
-      .filter((line) => line.trim().length > 0) // Remove empty lines after processing
+      .filter((line) => line.length > 0) // Kept lines are already trimmed
       .join("\n");
   }
 }
@@ -559,13 +712,15 @@ export function convertSimpleHeaders(content: string): string {
       const trimmedLine = line.trim();
 
       // Convert markdown headers to Tana headings and escape # symbols
-      const headerMatch = trimmedLine.match(/^(#{1,6})\s+(.+)$/);
+      const headerMatch = trimmedLine.startsWith("#")
+        ? trimmedLine.match(HEADING_PATTERN)
+        : null;
       if (headerMatch) {
         const text = headerMatch[2];
         return `!! ${text}`;
       } else {
         // Escape # symbols to prevent unwanted tag creation
-        return trimmedLine.replace(/#/g, "\\#");
+        return trimmedLine.replace(HASH_PATTERN, "\\#");
       }
     })
     .join("\n");
@@ -582,12 +737,9 @@ export function convertSimpleHeaders(content: string): string {
  */
 export function removeColonsInContent(content: string): string {
   if (!content) return "";
+  if (!content.includes("::")) return content;
 
-  return content
-    .split("\n")
-    .map((line) => {
-      // Remove all :: to prevent any field creation in content
-      return line.replace(/::/g, ":");
-    })
-    .join("\n");
+  // Remove all :: to prevent any field creation in content. A match can never
+  // span a newline, so the whole text is processed in one pass.
+  return content.replace(DOUBLE_COLON_PATTERN, ":");
 }
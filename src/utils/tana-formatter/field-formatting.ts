@@ -7,8 +7,15 @@ import {
   parseMarkdownStructure,
   convertNodesToTana,
   cleanContentForTana,
+  HAS_HEADINGS_PATTERN,
+  INVISIBLE_ONLY_PATTERN,
+  EMPTY_BULLET_MARKERS,
+  EMPTY_BULLET_PATTERN,
+  DASHES_ONLY_PATTERN,
 } from "./content-processing";
 
+const HASH_PATTERN = /#/g;
+
 /**
  * Format metadata fields for Tana
  *
@@ -60,11 +67,8 @@ export function formatMetadataFields(options: {
       .replace(/\\r/g, " ") // Replace escaped carriage returns
       .replace(/\\\\/g, "\\") // Unescape backslashes
       .replace(/\\"/g, '"') // Unescape quotes
-      .replace(/\r\n/g, " ") // Replace actual newlines
-      .replace(/\r/g, " ")
-      .replace(/\n/g, " ")
       .replace(/#\w+\b/g, "") // Remove hashtags like #hashtag
-      .replace(/\s+/g, " ") // Collapse multiple spaces
+      .replace(/\s+/g, " ") // Collapse whitespace, including actual newlines
       .replace(/::+/g, ":") // Remove multiple colons that could create fields
       .trim();
 
@@ -98,7 +102,7 @@ export function formatContentField(
   const lines = [`  - ${fieldName}::`];
 
   // Check if content has markdown headings - if so, use hierarchical processing
-  const hasHeadings = /^#{1,6}\s+.+$/m.test(content);
+  const hasHeadings = HAS_HEADINGS_PATTERN.test(content);
 
   if (hasHeadings) {
     // Use hierarchical markdown processing
@@ -226,38 +230,21 @@ export function formatLinesAsHierarchy(lines: string[]): string[] {
   }
 
   const filteredLines = lines.filter((line) => {
-    // Remove all Unicode whitespace and invisible characters
-    const cleaned = line.replace(
-      /[\s\u200B\u200C\u200E\u200F\u2028\u2029\uFEFF]|\u200D/gu,
-      "",
-    );
-    if (cleaned.length === 0) return false;
+    // Drop lines made up only of Unicode whitespace and invisible characters
+    if (INVISIBLE_ONLY_PATTERN.test(line)) return false;
 
     const trimmed = line.trim();
 
     // Filter out empty bullet nodes and lines with only invisible characters
     if (
-      trimmed === "-" ||
-      trimmed === "•" ||
-      trimmed === "*" ||
-      trimmed === "- •" ||
-      trimmed === "- *" ||
-      trimmed === "-•" ||
-      trimmed === "-*" ||
-      /^-\s*[•*\u200B\u200C\u200E\u200F\u2028\u2029\uFEFF]*(\u200D)*\s*$/u.test(
-        trimmed,
-      )
+      EMPTY_BULLET_MARKERS.has(trimmed) ||
+      EMPTY_BULLET_PATTERN.test(trimmed)
     ) {
       return false;
     }
 
     // Also filter lines that are just dashes with whitespace/invisible chars
-    if (
-      /^[-\s\u200B\u200C\u200E\u200F\u2028\u2029\uFEFF]*(\u200D)*$/u.test(
-        trimmed,
-      ) &&
-      trimmed.includes("-")
-    ) {
+    if (DASHES_ONLY_PATTERN.test(trimmed) && trimmed.includes("-")) {
       return false;
     }
 
@@ -268,16 +255,16 @@ export function formatLinesAsHierarchy(lines: string[]): string[] {
 
   if (filteredLines.length === 1) {
     // Single line
-    const escapedLine = filteredLines[0].trim().replace(/#/g, "\\#");
+    const escapedLine = filteredLines[0].trim().replace(HASH_PATTERN, "\\#");
     result.push(`- ${escapedLine}`);
   } else if (filteredLines.length > 1) {
     // Multiple lines - first as parent, rest as children
-    const escapedParent = filteredLines[0].trim().replace(/#/g, "\\#");
+    const escapedParent = filteredLines[0].trim().replace(HASH_PATTERN, "\\#");
     result.push(`- ${escapedParent}`);
-    filteredLines.slice(1).forEach((line) => {
-      const escapedLine = line.trim().replace(/#/g, "\\#");
+    for (let i = 1; i < filteredLines.length; i++) {
+      const escapedLine = filteredLines[i].trim().replace(HASH_PATTERN, "\\#");
       result.push(`  - ${escapedLine}`);
-    });
+    }
   }
 
   return result;
@@ -24,6 +24,11 @@ import {
 // Re-export types and utilities that commands might need
 export type { TranscriptChunk } from "./transcript-chunking";
 export type { ContentType } from "./content-detection";
+export {
+  removeColonsInContent,
+  getIndentWidth,
+  getLeadingWhitespace,
+} from "./content-processing";
 
 /**
  * Options for formatting content to Tana format
@@ -131,25 +131,24 @@ function findBestSplitPoint(
   // Find sentence boundaries in the search range
   const searchText = text.slice(searchStart, searchEnd);
   const sentencePattern = /[.!?]+\s+/g;
-  const sentenceMatches = Array.from(searchText.matchAll(sentencePattern));
 
-  if (sentenceMatches.length > 0) {
-    // Find the sentence boundary closest to our target
-    const targetRelative = targetPosition - searchStart;
+  // Find the sentence boundary closest to our target, scanning the matches
+  // as they are produced rather than collecting them into an array first
+  const targetRelative = targetPosition - searchStart;
+  let bestMatch: RegExpMatchArray | null = null;
+  let bestDistance = Infinity;
 
-    let bestMatch = sentenceMatches[0];
-    let bestDistance = Math.abs((bestMatch.index ?? 0) - targetRelative);
+  for (const match of searchText.matchAll(sentencePattern)) {
+    const matchIndex = match.index ?? 0;
+    const distance = Math.abs(matchIndex - targetRelative);
 
-    for (const match of sentenceMatches) {
-      const matchIndex = match.index ?? 0;
-      const distance = Math.abs(matchIndex - targetRelative);
-
-      if (distance < bestDistance) {
-        bestMatch = match;
-        bestDistance = distance;
-      }
+    if (distance < bestDistance) {
+      bestMatch = match;
+      bestDistance = distance;
     }
+  }
 
+  if (bestMatch !== null) {
     // Return the position after the sentence boundary
     const matchIndex = bestMatch.index ?? 0;
     const matchLength = bestMatch[0]?.length ?? 0;
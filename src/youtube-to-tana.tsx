@@ -6,10 +6,10 @@ import {
   getPreferenceValues,
 } from "@raycast/api";
 import { formatForTana } from "./utils/tana-formatter";
-import { exec } from "child_process";
+import { execFile } from "child_process";
 import { promisify } from "util";
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
 
 /**
  * YouTube to Tana Converter
@@ -59,33 +59,64 @@ interface VideoInfo {
   transcript?: string;
 }
 
+/**
+ * Named HTML entities understood by decodeHTMLEntities
+ */
+const NAMED_HTML_ENTITIES: Record<string, string> = {
+  amp: "&",
+  lt: "<",
+  gt: ">",
+  quot: '"',
+  apos: "'",
+  nbsp: " ",
+};
+
+/**
+ * Matches any supported HTML entity: named, hexadecimal or decimal
+ */
+const HTML_ENTITY_PATTERN =
+  /&(?:(amp|lt|gt|quot|apos|nbsp)|#x([0-9A-Fa-f]+)|#(\d+));/g;
+
 /**
  * Decode HTML entities in text content
  *
- * Converts common HTML entities (like &amp;, &lt;, &quot;) back to their
- * text equivalents for proper display in Tana.
+ * Converts common HTML entities (like &amp;, &lt;, &quot;) and numeric
+ * character references back to their text equivalents for proper display
+ * in Tana. All entity forms are matched in a single pass, so each entity
+ * is decoded exactly once.
  *
  * @param text - Text containing HTML entities
  * @returns Decoded text with entities converted to characters
  */
 function decodeHTMLEntities(text: string): string {
-  let decoded = text
-    .replace(/&amp;/g, "&")
-    .replace(/&lt;/g, "<")
-    .replace(/&gt;/g, ">")
-    .replace(/&quot;/g, '"')
-    .replace(/&#39;/g, "'")
-    .replace(/&apos;/g, "'")
-    .replace(/&nbsp;/g, " ");
-
-  // Handle numeric entities (decimal and hexadecimal)
-  decoded = decoded
-    .replace(/&#x([0-9A-Fa-f]+);/g, (_, hex) =>
-      String.fromCharCode(parseInt(hex, 16)),
-    )
-    .replace(/&#(\d+);/g, (_, code) => String.fromCharCode(Number(code)));
-
-  return decoded;
+  return text.replace(HTML_ENTITY_PATTERN, decodeHTMLEntity);
+}
+
+/**
+ * Replacement callback for HTML_ENTITY_PATTERN
+ *
+ * Numeric references are decoded by code point so characters outside the
+ * Basic Multilingual Plane (such as emoji) survive intact. References that
+ * are not valid code points are left as written.
+ *
+ * @param entity - The full matched entity
+ * @param named - Entity name for named entities
+ * @param hex - Hexadecimal digits for &#x...; references
+ * @param decimal - Decimal digits for &#...; references
+ * @returns The decoded character(s)
+ */
+function decodeHTMLEntity(
+  entity: string,
+  named?: string,
+  hex?: string,
+  decimal?: string,
+): string {
+  if (named) {
+    return NAMED_HTML_ENTITIES[named];
+  }
+
+  const codePoint = hex ? parseInt(hex, 16) : Number(decimal);
+  return codePoint <= 0x10ffff ? String.fromCodePoint(codePoint) : entity;
 }
 
 /**
@@ -915,7 +946,7 @@ export default async function Command() {
 
     // Open Tana and update toast to success
     try {
-      await execAsync("open tana://");
+      await execFileAsync("open", ["tana://"]);
       // Update toast to success
       toast.style = Toast.Style.Success;
       if (transcript) {